@@ -1,24 +1,44 @@
 """Jina API client implementation with MCP support."""
 import asyncio
-import json
 import logging
 import os
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+import random
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import httpx
-from pydantic import BaseModel, Field, ConfigDict
+import orjson
 
 from .config import JINA_READER_ENDPOINT, JINA_SEARCH_ENDPOINT, settings
+from .ratelimit import AIMDLimiter, TokenBucket
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-class MCPStreamEvent(BaseModel):
-    """MCP stream event model."""
+# Retry policy for throttled / unavailable Jina responses
+RETRY_STATUS_CODES = (429, 503)
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30.0
+# Longest Retry-After we are willing to wait; longer ones fail immediately
+RETRY_AFTER_MAX = 300.0
+
+# Consumed bytes after which the SSE read buffer is compacted
+SSE_BUFFER_COMPACT_THRESHOLD = 64 * 1024
+
+# Maximum number of URLs kept in each client's reader cache
+READER_CACHE_MAXSIZE = 256
+
+@dataclass(slots=True)
+class MCPStreamEvent:
+    """MCP stream event."""
     event: str
     data: Dict[str, Any]
-    
-    model_config = ConfigDict(extra='allow')
 
 class MCPStreamHandler:
     """Handler for MCP streaming responses."""
@@ -30,43 +50,55 @@ class MCPStreamHandler:
     
     async def __aiter__(self) -> AsyncGenerator[MCPStreamEvent, None]:
         """Iterate over SSE events."""
-        buffer = b""
+        buffer = bytearray()
+        start = 0
         async for chunk in self.response.aiter_bytes():
-            buffer += chunk
-            while b"\n\n" in buffer:
-                event_data, buffer = buffer.split(b"\n\n", 1)
+            # Only rescan the tail that may complete a separator split across chunks
+            search_from = max(start, len(buffer) - 1)
+            buffer.extend(chunk)
+            while True:
+                idx = buffer.find(b"\n\n", search_from)
+                if idx < 0:
+                    break
+                event_data = bytes(memoryview(buffer)[start:idx])
+                start = search_from = idx + 2
                 if not event_data.strip():
                     continue
                     
                 event = self._parse_event(event_data)
                 if event:
                     yield event
+            
+            # Drop consumed bytes once enough have accumulated
+            if start > SSE_BUFFER_COMPACT_THRESHOLD:
+                del buffer[:start]
+                start = 0
     
     def _parse_event(self, event_data: bytes) -> Optional[MCPStreamEvent]:
         """Parse a single SSE event."""
         try:
-            lines = event_data.decode(self.encoding).split("\n")
-            event = {"event": "message", "data": {}}
+            event_name = "message"
+            data: Dict[str, Any] = {}
             
-            for line in lines:
-                if ":" not in line:
+            for line in event_data.split(b"\n"):
+                field, sep, value = line.partition(b":")
+                if not sep:
                     continue
                     
-                field, value = line.split(":", 1)
                 field = field.strip()
                 value = value.strip()
                 
-                if field == "event":
-                    event["event"] = value
-                elif field == "data":
+                if field == b"event":
+                    event_name = value.decode(self.encoding)
+                elif field == b"data":
                     try:
-                        event["data"] = json.loads(value) if value else {}
-                    except json.JSONDecodeError:
-                        event["data"] = {"raw": value}
+                        data = orjson.loads(value) if value else {}
+                    except orjson.JSONDecodeError:
+                        data = {"raw": value.decode(self.encoding)}
             
-            return MCPStreamEvent(**event)
+            return MCPStreamEvent(event=event_name, data=data)
         except Exception as e:
-            logger.error(f"Error parsing SSE event: {str(e)}")
+            logger.error("Error parsing SSE event: %s", e)
             return None
 
 
@@ -79,7 +111,9 @@ class JinaClient:
         Get your Jina AI API key for free: https://jina.ai/?sui=apikey
         Args:
             api_key: Jina API key. If not provided, will use JINA_API_KEY from environment.
-            base_url: (Unused for official APIs)
+            base_url: Base URL for generic _make_request calls. Defaults to
+                JINA_API_BASE; read_url and search always use the Reader and
+                Search endpoints from config.
         """
         self.api_key = api_key or os.environ.get("JINA_API_KEY")
         if not self.api_key:
@@ -90,10 +124,63 @@ class JinaClient:
             "Accept": "application/json",
         }
         self.timeout = 60.0
+        self.base_url = (base_url or settings.jina_api_base).rstrip("/")
+        self._cache_ttl = settings.jina_reader_cache_ttl
+        # Recently read URLs: url -> (expiry time, markdown content)
+        self._url_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._loop_ref: Optional["weakref.ReferenceType[asyncio.AbstractEventLoop]"] = None
+        self._reset_loop_state()
+
+    def _reset_loop_state(self) -> None:
+        """(Re)create the HTTP client and asyncio primitives bound to an event loop."""
+        self._client: Optional[httpx.AsyncClient] = None
+        self._concurrency = AIMDLimiter(
+            initial=settings.jina_initial_concurrency,
+            max_limit=settings.jina_max_concurrency,
+        )
+        # Upstream calls currently in flight, keyed by request identity
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Dict[str, Any]]"] = {}
+        # Only one retry request may be in flight at a time to avoid retry storms
+        self._retry_semaphore = asyncio.Semaphore(1)
+        self._rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate=settings.jina_reader_rps, capacity=settings.jina_reader_rps)
+            if settings.jina_reader_rps > 0
+            else None
+        )
+
+    def _bind_loop(self) -> None:
+        """Rebuild loop-bound state if this instance is used from a new event loop.
+
+        httpx clients, locks, semaphores, conditions and futures all belong to
+        the loop they were first used on, so they are replaced together.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop_ref is None or self._loop_ref() is not loop:
+            if self._loop_ref is not None:
+                self._reset_loop_state()
+            self._loop_ref = weakref.ref(loop)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running loop, creating it on first use."""
+        self._bind_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=128,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
 
     async def close(self):
         """Close the HTTP client."""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -119,23 +206,24 @@ class JinaClient:
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-        logger.debug(f"Making {method} request to {url}")
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        logger.debug("Making %s request to %s", method, url)
         
         try:
-            response = await self.client.request(method, path, **kwargs)
+            client = await self._get_client()
+            response = await client.request(method, url, **kwargs)
             response.raise_for_status()
             
             content_type = response.headers.get('content-type', '')
             if 'application/json' in content_type:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 return {"content": response.text}
                 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error {e.response.status_code}"
             try:
-                error_data = e.response.json()
+                error_data = orjson.loads(e.response.content)
                 error_msg = f"{error_msg}: {error_data.get('detail', error_data)}"
             except:
                 error_msg = f"{error_msg}: {e.response.text}"
@@ -144,9 +232,129 @@ class JinaClient:
             raise RuntimeError(error_msg) from e
         
         except Exception as e:
-            logger.error(f"Request failed: {str(e)}")
+            logger.error("Request failed: %s", e)
             raise
 
+    async def _send(
+        self, endpoint: str, body: bytes
+    ) -> Tuple[httpx.Response, bytearray]:
+        """
+        Send a rate- and concurrency-limited POST of a pre-encoded JSON body.
+
+        The body is streamed into a single bytearray as it arrives rather
+        than buffered by httpx and joined afterwards.
+
+        Returns:
+            The (closed) response and its raw body
+        """
+        client = await self._get_client()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        async with self._concurrency:
+            async with client.stream("POST", endpoint, content=body) as response:
+                await self._concurrency.record(response.status_code in RETRY_STATUS_CODES)
+                logger.debug(
+                    "POST %s -> %s over %s", endpoint, response.status_code, response.http_version
+                )
+                content = bytearray()
+                async for chunk in response.aiter_bytes():
+                    content.extend(chunk)
+        return response, content
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Return the Retry-After header in seconds (delta or HTTP date), or 0."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return 0.0
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    @classmethod
+    def _retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """Return the delay before a retry: Retry-After, or full jitter backoff if longer."""
+        backoff = random.random() * min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt)
+        return max(cls._retry_after(response), backoff)
+
+    async def _post(self, endpoint: str, body: bytes) -> Dict[str, Any]:
+        """
+        POST to a Jina endpoint, retrying 429/503 responses with backoff.
+
+        Raises:
+            httpx.HTTPStatusError: If the request still fails after retrying
+        """
+        response, content = await self._send(endpoint, body)
+        attempt = 0
+        while response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+            delay = self._retry_delay(response, attempt)
+            if delay > RETRY_AFTER_MAX:
+                # Never retry early, and waiting this long would stall the caller
+                logger.warning(
+                    "Jina returned %s with Retry-After %.0fs, not retrying",
+                    response.status_code, delay,
+                )
+                break
+            logger.warning(
+                "Jina returned %s, retrying in %.2fs (attempt %d/%d)",
+                response.status_code, delay, attempt + 1, MAX_RETRIES,
+            )
+            # Throttled callers back off concurrently; only the resend is
+            # serialized, so a queue of retries cannot stack their delays
+            await asyncio.sleep(delay)
+            async with self._retry_semaphore:
+                response, content = await self._send(endpoint, body)
+            attempt += 1
+        response.raise_for_status()
+        return orjson.loads(content)
+
+    async def _coalesced_post(
+        self, key: Tuple[Any, ...], endpoint: str, body: bytes
+    ) -> Dict[str, Any]:
+        """
+        POST via _post, sharing one upstream call among concurrent identical requests.
+
+        The request runs as a task so that a cancelled caller does not
+        cancel it for the others still waiting on the same key.
+        """
+        self._bind_loop()
+        inflight = self._inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._post(endpoint, body))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def _get_cached_url(self, url: str) -> Optional[str]:
+        """Return cached reader content for a URL if it has not expired."""
+        entry = self._url_cache.get(url)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at < time.monotonic():
+            del self._url_cache[url]
+            return None
+        self._url_cache.move_to_end(url)
+        return content
+
+    def _cache_url(self, url: str, content: str) -> None:
+        """Store reader content for a URL, evicting the least recently used entry."""
+        if self._cache_ttl <= 0:
+            return
+        self._url_cache[url] = (time.monotonic() + self._cache_ttl, content)
+        self._url_cache.move_to_end(url)
+        if len(self._url_cache) > READER_CACHE_MAXSIZE:
+            self._url_cache.popitem(last=False)
+
     async def read_url(
         self,
         url: str,
@@ -158,20 +366,17 @@ class JinaClient:
         """
         Read content from a URL using Jina's Reader API. Always returns markdown text from response['data']['content'].
         """
-        endpoint = "https://r.jina.ai/"
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        payload = {"url": url}
+        cached = self._get_cached_url(url)
+        if cached is not None:
+            return cached
+        body = orjson.dumps({"url": url})
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(endpoint, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", {}).get("content", "")
+            data = await self._coalesced_post(("read", url), JINA_READER_ENDPOINT, body)
+            content = data.get("data", {}).get("content", "")
+            self._cache_url(url, content)
+            return content
         except Exception as e:
-            logger.error(f"Error calling Jina Reader API: {e}")
+            logger.error("Error calling Jina Reader API: %s", e)
             raise
 
     async def search(
@@ -185,20 +390,12 @@ class JinaClient:
         """
         Search using Jina's Search API. Always returns a list of results from response['data'].
         """
-        endpoint = "https://s.jina.ai/"
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        payload = {"q": q, "num": limit}
+        body = orjson.dumps({"q": q, "num": limit})
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(endpoint, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", [])
+            data = await self._coalesced_post(("search", q, limit), JINA_SEARCH_ENDPOINT, body)
+            return data.get("data", [])
         except Exception as e:
-            logger.error(f"Error calling Jina Search API: {e}")
+            logger.error("Error calling Jina Search API: %s", e)
             raise
 
     async def process_mcp_request(
@@ -228,13 +425,45 @@ class JinaClient:
             
         # Handle Jina API methods
         elif method == "jina_reader":
-            return await self.read_url(stream=stream, **params)
+            return await self.read_url(**params)
             
         elif method == "jina_search":
-            return await self.search(stream=stream, **params)
+            return await self.search(**params)
             
         else:
             raise ValueError(f"Unknown MCP method: {method}")
+
+    async def process_mcp_batch(
+        self, calls: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several independent MCP requests concurrently.
+
+        Args:
+            calls: List of {"method": ..., "params": {...}} dicts
+
+        Returns:
+            List of {"result": ...} or {"error": {...}} dicts, in call order
+        """
+        results = await asyncio.gather(
+            *(self._process_batch_call(call) for call in calls),
+            return_exceptions=True,
+        )
+        return [
+            {"error": {"code": -32603, "message": str(r) or type(r).__name__}}
+            if isinstance(r, BaseException)
+            else r
+            for r in results
+        ]
+
+    async def _process_batch_call(self, call: Any) -> Dict[str, Any]:
+        """Validate and run a single batch entry, returning its MCP envelope."""
+        if not isinstance(call, dict) or not isinstance(call.get("method"), str):
+            return {"error": {"code": -32600, "message": "Invalid call: 'method' must be a string"}}
+        params = call.get("params") or {}
+        if not isinstance(params, dict):
+            return {"error": {"code": -32600, "message": "Invalid call: 'params' must be an object"}}
+        return {"result": await self.process_mcp_request(call["method"], params)}
     
     # Context manager support
     async def __aenter__(self):
@@ -15,6 +15,25 @@ class Settings(BaseSettings):
         description="Base URL for Jina API",
     )
 
+    jina_reader_rps: float = Field(
+        10.0,
+        description="Max Jina Reader/Search requests per second per API key (0 disables)",
+    )
+
+    jina_initial_concurrency: int = Field(
+        4,
+        description="Initial number of concurrent Jina requests per API key",
+    )
+    jina_max_concurrency: int = Field(
+        32,
+        description="Upper bound for the adaptive Jina request concurrency",
+    )
+
+    jina_reader_cache_ttl: float = Field(
+        300.0,
+        description="Seconds to cache Jina Reader results per URL (0 disables)",
+    )
+
     # Server Configuration
     host: str = Field("0.0.0.0", description="Host to bind the server to")
     port: int = Field(8000, description="Port to bind the server to")
@@ -42,8 +61,8 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # Jina API endpoints
-JINA_READER_ENDPOINT = f"{settings.jina_api_base}/v1/reader"
-JINA_SEARCH_ENDPOINT = f"{settings.jina_api_base}/v1/search"
+JINA_READER_ENDPOINT = "https://r.jina.ai/"
+JINA_SEARCH_ENDPOINT = "https://s.jina.ai/"
 
 # Server configuration
 SERVER_CONFIG = {
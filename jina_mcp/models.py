@@ -1,4 +1,9 @@
-"""Pydantic models for MCP protocol and Jina API."""
+"""Pydantic models for MCP protocol and Jina API.
+
+Outbound-only structures are plain slotted dataclasses; pydantic models
+are kept for data that needs validating.
+"""
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -21,7 +26,8 @@ class MCPRequest(BaseModel):
     id: Optional[Union[str, int, float]] = None
 
 
-class MCPResult(BaseModel):
+@dataclass(slots=True)
+class MCPResult:
     """MCP result model."""
 
     result: Any
@@ -37,7 +43,8 @@ class MCPErrorResponse(BaseModel):
     jsonrpc: str = "2.0"
 
 
-class MCPStreamResponse(BaseModel):
+@dataclass(slots=True)
+class MCPStreamResponse:
     """MCP stream response model."""
 
     event: str
@@ -0,0 +1,152 @@
+"""Client-side rate and concurrency limiting for Jina API calls."""
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Asyncio token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size. Defaults to ``rate``, and is never
+                below one token so that fractional rates can still bank a token.
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._updated is not None:
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            # Hold the lock while waiting so callers are served in order
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._tokens = 0
+            self._updated = time.monotonic()
+
+
+class AdmissionController:
+    """Admission counter gated by an ``asyncio.Condition``.
+
+    Works like a semaphore, but the cap can be resized at runtime without
+    touching private ``asyncio.Semaphore`` state.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Maximum number of concurrently admitted callers
+        """
+        self._admitted = 0
+        self._max = max_concurrency
+        self._cond = asyncio.Condition()
+
+    @property
+    def max_concurrency(self) -> int:
+        """Current admission cap."""
+        return self._max
+
+    @property
+    def admitted(self) -> int:
+        """Number of callers currently admitted."""
+        return self._admitted
+
+    async def acquire(self) -> None:
+        """Wait until below the cap and take a slot."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._admitted < self._max)
+            self._admitted += 1
+
+    async def release(self) -> None:
+        """Give back a slot and wake one waiter."""
+        async with self._cond:
+            self._admitted -= 1
+            self._cond.notify(1)
+
+    async def resize(self, max_concurrency: int) -> None:
+        """Change the cap, waking as many waiters as now fit under it."""
+        async with self._cond:
+            self._max = max_concurrency
+            self._cond.notify(max(0, self._max - self._admitted))
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
+class AIMDLimiter:
+    """Concurrency limit that adapts to throttling feedback.
+
+    The limit grows additively (by ``1 / limit`` per success, roughly one
+    slot per window) and is halved whenever the server signals throttling.
+    Admission is enforced by an :class:`AdmissionController` resized to the
+    whole part of the limit. Use as ``async with limiter:`` and await
+    :meth:`record` with the outcome.
+    """
+
+    def __init__(self, initial: float, max_limit: float, min_limit: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            max_limit: Upper bound for the limit
+            min_limit: Lower bound for the limit
+        """
+        self._min = min_limit
+        self._max = max(max_limit, min_limit)
+        self._limit = min(self._max, max(self._min, float(initial)))
+        self._admission = AdmissionController(int(self._limit))
+
+    @property
+    def limit(self) -> float:
+        """Current concurrency limit."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        await self._admission.acquire()
+
+    async def release(self) -> None:
+        """Give back a slot."""
+        await self._admission.release()
+
+    async def record(self, throttled: bool) -> None:
+        """Adjust the limit from the outcome of a request."""
+        if throttled:
+            self._limit = max(self._min, self._limit * 0.5)
+        else:
+            self._limit = min(self._max, self._limit + 1 / self._limit)
+        if int(self._limit) != self._admission.max_concurrency:
+            await self._admission.resize(int(self._limit))
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
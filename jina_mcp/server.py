@@ -1,20 +1,25 @@
 """Jina AI MCP Server with SSE support."""
 import asyncio
-import json
 import logging
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional, AsyncGenerator
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 from pydantic import BaseModel, Field
-from sse_starlette.sse import EventSourceResponse
 from fastapi import Request, Response, FastAPI, Depends
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from .config import settings
+from .config import JINA_READER_ENDPOINT, JINA_SEARCH_ENDPOINT, settings
 from .client import JinaClient
 
+# Bind settings read by the server once at import time
+_HOST, _PORT, _DEBUG, _LOG_LEVEL = settings.host, settings.port, settings.debug, settings.log_level
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,22 +27,68 @@ logger = logging.getLogger(__name__)
 # Store connected SSE clients
 sse_clients = set()
 
+# Maximum number of undelivered frames buffered per SSE client
+SSE_QUEUE_MAXSIZE = 256
+
+# Seconds of inactivity before an SSE client is sent a keep-alive ping
+SSE_KEEPALIVE_INTERVAL = 30
+
+# Maximum number of per-API-key Jina clients kept alive at once
+JINA_CLIENT_CACHE_SIZE = 32
+
+# Jina clients keyed by API key (least recently used first), so each key
+# reuses one connection pool without the registry growing unbounded
+jina_clients: "OrderedDict[str, JinaClient]" = OrderedDict()
+
+
+async def get_jina_client(api_key: str) -> JinaClient:
+    """Return the shared JinaClient for an API key, creating it if needed.
+
+    When the registry is full the least recently used client is evicted
+    and its connection pool closed.
+    """
+    client = jina_clients.get(api_key)
+    if client is not None:
+        jina_clients.move_to_end(api_key)
+        return client
+    client = JinaClient(api_key=api_key)
+    jina_clients[api_key] = client
+    while len(jina_clients) > JINA_CLIENT_CACHE_SIZE:
+        _, evicted = jina_clients.popitem(last=False)
+        await evicted.close()
+    return client
+
+
+async def close_jina_clients() -> None:
+    """Close and forget every pooled Jina client."""
+    clients = list(jina_clients.values())
+    jina_clients.clear()
+    for client in clients:
+        await client.close()
+
 # Initialize MCP
 mcp = FastMCP(
     "jina-ai-search",
     dependencies=["mcp[cli]>=1.9.3"],
     cors_origins=["*"],
-    host=settings.host,
-    port=settings.port,
-    debug=settings.debug,
-    log_level=settings.log_level  # Already in uppercase from config
+    host=_HOST,
+    port=_PORT,
+    debug=_DEBUG,
+    log_level=_LOG_LEVEL  # Already in uppercase from config
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close pooled Jina HTTP clients on shutdown."""
+    yield
+    await close_jina_clients()
+
 # Create FastAPI app
 app = FastAPI(
     title="Jina MCP Server",
     description="Jina AI Model Context Protocol server with SSE support",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -64,12 +115,11 @@ async def read_url(
 ) -> Dict[str, Any]:
     """Read content from a URL using Jina's Reader API."""
     try:
-        jina_client = JinaClient(api_key=api_key)
+        jina_client = await get_jina_client(api_key)
         response = await jina_client.read_url(url)
         return {"result": {"content": response}}
     except Exception as e:
-        error_msg = f"Error reading URL {url}: {str(e)}"
-        logger.error(error_msg, exc_info=True)
+        logger.error("Error reading URL %s: %s", url, e, exc_info=True)
         raise e
 
 @mcp.tool(
@@ -82,75 +132,142 @@ async def search(
 ) -> dict:
     """Search using Jina's Search API."""
     try:
-        jina_client = JinaClient(api_key=api_key)
+        jina_client = await get_jina_client(api_key)
         result = await jina_client.search(q)
         return {"result": result}
     except Exception as e:
-        error_msg = f"Search failed: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        raise ToolError(error_msg)
+        logger.error("Search failed: %s", e, exc_info=True)
+        raise ToolError(f"Search failed: {str(e)}")
+
+@mcp.tool(
+    name="jina_batch",
+    description="Read content from several URLs in parallel using Jina's Reader API"
+)
+async def read_urls(
+    urls: List[str],
+    api_key: str
+) -> dict:
+    """Read content from several URLs concurrently."""
+    try:
+        jina_client = await get_jina_client(api_key)
+        results = await jina_client.process_mcp_batch(
+            [{"method": "jina_reader", "params": {"url": url}} for url in urls]
+        )
+        # Shape each successful entry like the single jina_reader tool result
+        return {
+            "result": [
+                {"result": {"content": r["result"]}} if "result" in r else r
+                for r in results
+            ]
+        }
+    except Exception as e:
+        logger.error("Batch read failed: %s", e, exc_info=True)
+        raise ToolError(f"Batch read failed: {str(e)}")
 
 # Tools are registered with the @mcp.tool decorator
 
+def _build_sse_frame(
+    event: str,
+    data: bytes,
+    id: Optional[str] = None,
+    retry: Optional[int] = None
+) -> bytes:
+    """Build a fully encoded SSE frame that can be written to any client as-is."""
+    frame = b"event: %s\n" % event.encode("utf-8")
+    for line in data.split(b"\n"):
+        frame += b"data: %s\n" % line
+    if id is not None:
+        frame += b"id: %s\n" % id.encode("utf-8")
+    if retry is not None:
+        frame += b"retry: %d\n" % retry
+    return frame + b"\n"
+
+# Keep-alive frame, built once and reused for every idle interval
+PING_FRAME = _build_sse_frame("ping", b"")
+
 # SSE Event Generator
-async def event_generator(request: Request) -> AsyncGenerator[Dict[str, str], None]:
-    """Generate server-sent events."""
+async def event_generator(request: Request) -> AsyncGenerator[bytes, None]:
+    """Generate server-sent events as pre-encoded frames."""
     client_id = str(uuid.uuid4())
-    queue = asyncio.Queue()
+    queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
     sse_clients.add(queue)
+    get_task: Optional[asyncio.Future] = None
     
     try:
         # Send initial connection event
-        yield {
-            "event": "connection",
-            "data": json.dumps({"client_id": client_id, "status": "connected"})
-        }
+        yield _build_sse_frame(
+            "connection",
+            orjson.dumps({"client_id": client_id, "status": "connected"})
+        )
         
         # Keep connection alive
         while True:
             if await request.is_disconnected():
-                logger.info(f"Client {client_id} disconnected")
+                logger.info("Client %s disconnected", client_id)
                 break
                 
-            try:
-                # Wait for a message with timeout
-                message = await asyncio.wait_for(queue.get(), timeout=30)
-                yield message
-            except asyncio.TimeoutError:
+            # Wait for a message without raising on timeout
+            get_task = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({get_task}, timeout=SSE_KEEPALIVE_INTERVAL)
+            if get_task in done:
+                yield get_task.result()
+            else:
+                get_task.cancel()
                 # Send a keep-alive ping
-                yield {"event": "ping", "data": ""}
+                yield PING_FRAME
                 
     except asyncio.CancelledError:
-        logger.info(f"Client {client_id} connection cancelled")
+        logger.info("Client %s connection cancelled", client_id)
     finally:
+        if get_task is not None and not get_task.done():
+            get_task.cancel()
         sse_clients.remove(queue)
 
 # Broadcast message to all connected clients
 async def broadcast_message(event: str, data: Dict[str, Any]):
     """Broadcast a message to all connected SSE clients."""
-    message = {
-        "event": event,
-        "data": json.dumps(data),
-        "id": str(uuid.uuid4()),
-        "retry": 30000  # 30 seconds
-    }
+    # Encode once and share the same frame with every subscriber
+    frame = _build_sse_frame(
+        event,
+        orjson.dumps(data),
+        str(uuid.uuid4()),
+        30000  # 30 seconds
+    )
     
-    for queue in list(sse_clients):
-        await queue.put(message)
+    # Snapshot subscribers so connects/disconnects during fan-out are safe.
+    # put_nowait never awaits, so delivery to every client completes in a
+    # single event-loop step and no client can delay another.
+    queues = tuple(sse_clients)
+    logger.debug("Broadcasting %s event to %d clients", event, len(queues))
+    for queue in queues:
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Slow consumer: drop its oldest frame rather than grow unbounded
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            queue.put_nowait(frame)
 
 # SSE endpoint
 @app.get("/sse")
 async def sse_endpoint(request: Request):
     """SSE endpoint for real-time updates."""
-    return EventSourceResponse(event_generator(request))
+    return StreamingResponse(
+        event_generator(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 def run_server():
     """Run the MCP server with SSE support."""
-    logger.info(f"Starting Jina MCP Server with SSE on {settings.host}:{settings.port}")
-    logger.info(f"API Base URL: {settings.jina_api_base}")
-    logger.info(f"Debug Mode: {settings.debug}")
-    logger.info(f"SSE Endpoint: http://{settings.host}:{settings.port}/sse")
-    logger.info(f"MCP Endpoint: http://{settings.host}:{settings.port}/mcp")
+    logger.info("Starting Jina MCP Server with SSE on %s:%s", _HOST, _PORT)
+    logger.info("Jina Reader Endpoint: %s", JINA_READER_ENDPOINT)
+    logger.info("Jina Search Endpoint: %s", JINA_SEARCH_ENDPOINT)
+    logger.info("Debug Mode: %s", _DEBUG)
+    logger.info("SSE Endpoint: http://%s:%s/sse", _HOST, _PORT)
+    logger.info("MCP Endpoint: http://%s:%s/mcp", _HOST, _PORT)
     
     # Run the MCP server
     mcp.run(transport="sse")
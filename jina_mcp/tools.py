@@ -1,6 +1,7 @@
 """MCP Tools implementation for Jina AI Search."""
 from typing import Any, Dict, List, Optional
 
+import orjson
 from pydantic import BaseModel, Field
 
 from .client import JinaClient
@@ -31,6 +32,11 @@ class JinaTools:
         """Initialize with a JinaClient instance."""
         self.client = client
         self._tools = self._get_tools()
+        # Tool definitions are static, so serialize them once; list_tools
+        # decodes a fresh copy per call so callers cannot mutate shared state
+        self._tool_list_json = orjson.dumps(
+            [tool.model_dump() for tool in self._tools.values()]
+        )
 
     def _get_tools(self) -> Dict[str, ToolDefinition]:
         """Get all available tools."""
@@ -73,7 +79,7 @@ class JinaTools:
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """List all available tools."""
-        return [tool.dict() for tool in self._tools.values()]
+        return orjson.loads(self._tool_list_json)
 
     def get_tool(self, name: str) -> Optional[ToolDefinition]:
         """Get a specific tool by name."""
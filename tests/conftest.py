@@ -0,0 +1,25 @@
+"""Shared fixtures for the jina_mcp test suite."""
+import functools
+
+import httpx
+import pytest
+
+import jina_mcp.client as client_module
+from jina_mcp.client import JinaClient
+from jina_mcp.config import settings
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build a JinaClient whose HTTP client talks to an in-process handler."""
+    monkeypatch.setattr(settings, "jina_reader_rps", 0)
+
+    def factory(handler):
+        monkeypatch.setattr(
+            client_module.httpx,
+            "AsyncClient",
+            functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+        return JinaClient(api_key="test-key")
+
+    return factory
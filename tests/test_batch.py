@@ -0,0 +1,57 @@
+"""Tests for concurrent MCP batch dispatch and the jina_batch tool."""
+import asyncio
+
+import httpx
+import pytest
+
+from jina_mcp import server
+
+
+def _ok(data):
+    return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_malformed_calls_as_errors(make_client):
+    client = make_client(lambda request: _ok({"content": "page"}))
+    results = await client.process_mcp_batch([
+        {"method": "jina_reader", "params": {"url": "https://a"}},
+        {"params": {}},
+        {"method": "nope", "params": {}},
+    ])
+    assert results[0] == {"result": "page"}
+    assert results[1]["error"]["code"] == -32600
+    assert results[2]["error"]["code"] == -32603
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_matches_single_reader_result_shape(make_client, monkeypatch):
+    client = make_client(lambda request: _ok({"content": "page"}))
+
+    async def get_client(api_key):
+        return client
+
+    monkeypatch.setattr(server, "get_jina_client", get_client)
+    single = await server.read_url("https://a", api_key="k")
+    batch = await server.read_urls(["https://a", "https://b"], api_key="k")
+    assert batch["result"] == [single, single]
+
+
+@pytest.mark.asyncio
+async def test_batch_dispatches_calls_concurrently(make_client):
+    current = peak = 0
+
+    async def handler(request):
+        nonlocal current, peak
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+        return _ok({"content": "page"})
+
+    client = make_client(handler)
+    results = await client.process_mcp_batch(
+        [{"method": "jina_reader", "params": {"url": f"https://{i}"}} for i in range(3)]
+    )
+    assert results == [{"result": "page"}] * 3
+    assert peak == 3
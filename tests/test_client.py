@@ -0,0 +1,24 @@
+"""Tests for JinaClient connection pooling and event-loop handling."""
+import asyncio
+
+import httpx
+import orjson
+
+from jina_mcp.config import settings
+
+
+def _ok(data):
+    return httpx.Response(200, json={"data": data})
+
+
+def test_client_is_reusable_across_event_loops(make_client, monkeypatch):
+    monkeypatch.setattr(settings, "jina_reader_rps", 1000)
+    client = make_client(lambda request: _ok([orjson.loads(request.content)]))
+
+    async def burst():
+        return await asyncio.gather(*(client.search(f"q{i}") for i in range(40)))
+
+    first = asyncio.run(burst())
+    second = asyncio.run(burst())
+    assert len(first) == len(second) == 40
+    assert second[3] == [{"q": "q3", "num": 5}]
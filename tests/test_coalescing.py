@@ -0,0 +1,58 @@
+"""Tests for single-flight coalescing of identical in-flight requests."""
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+
+def _ok(data):
+    return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced(make_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(orjson.loads(request.content))
+        await asyncio.sleep(0.05)
+        return _ok({"content": "# page"})
+
+    client = make_client(handler)
+    results = await asyncio.gather(*(client.read_url("https://jina.ai") for _ in range(5)))
+    assert results == ["# page"] * 5
+    assert calls == [{"url": "https://jina.ai"}]
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request(make_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(orjson.loads(request.content))
+        await asyncio.sleep(0.02)
+        return _ok([{"title": "hit"}])
+
+    client = make_client(handler)
+    first = asyncio.ensure_future(client.search("q"))
+    second = asyncio.ensure_future(client.search("q"))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == [{"title": "hit"}]
+    assert first.cancelled()
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(orjson.loads(request.content))
+        return _ok([])
+
+    client = make_client(handler)
+    await asyncio.gather(client.search("a"), client.search("a", limit=3), client.search("b"))
+    assert len(calls) == 3
@@ -0,0 +1,158 @@
+"""Tests for the client-side rate and concurrency limiters."""
+import asyncio
+import types
+
+import pytest
+
+from jina_mcp import ratelimit
+from jina_mcp.ratelimit import AdmissionController, AIMDLimiter, TokenBucket
+
+
+async def _settle():
+    """Let woken waiters run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_admission_caps_concurrency():
+    admission = AdmissionController(2)
+    await admission.acquire()
+    await admission.acquire()
+
+    waiter = asyncio.ensure_future(admission.acquire())
+    await _settle()
+    assert not waiter.done()
+
+    await admission.release()
+    await _settle()
+    assert waiter.done()
+    assert admission.admitted == 2
+
+
+@pytest.mark.asyncio
+async def test_admission_grow_wakes_waiters():
+    admission = AdmissionController(1)
+    await admission.acquire()
+    waiters = [asyncio.ensure_future(admission.acquire()) for _ in range(3)]
+    await _settle()
+    assert not any(w.done() for w in waiters)
+
+    await admission.resize(3)
+    await _settle()
+    assert sum(w.done() for w in waiters) == 2
+    assert admission.admitted == 3
+
+    await admission.resize(4)
+    await _settle()
+    assert all(w.done() for w in waiters)
+
+
+@pytest.mark.asyncio
+async def test_admission_shrink_blocks_until_below_cap():
+    admission = AdmissionController(3)
+    for _ in range(3):
+        await admission.acquire()
+    await admission.resize(1)
+
+    waiter = asyncio.ensure_future(admission.acquire())
+    await admission.release()
+    await admission.release()
+    await _settle()
+    assert not waiter.done()
+
+    await admission.release()
+    await _settle()
+    assert waiter.done()
+    assert admission.admitted == 1
+
+
+@pytest.mark.asyncio
+async def test_aimd_halves_on_throttle_and_recovers():
+    limiter = AIMDLimiter(initial=8, max_limit=16)
+
+    await limiter.record(throttled=True)
+    assert limiter.limit == 4
+    assert limiter._admission.max_concurrency == 4
+
+    await limiter.record(throttled=True)
+    await limiter.record(throttled=True)
+    await limiter.record(throttled=True)
+    assert limiter.limit == 1  # clamped to min_limit
+
+    for _ in range(3):
+        await limiter.record(throttled=False)
+    assert 2 <= limiter.limit < 3
+    assert limiter._admission.max_concurrency == 2
+
+
+@pytest.mark.asyncio
+async def test_aimd_limits_in_flight_requests():
+    limiter = AIMDLimiter(initial=2, max_limit=2)
+    current = peak = 0
+
+    async def job():
+        nonlocal current, peak
+        async with limiter:
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.01)
+            current -= 1
+
+    await asyncio.gather(*(job() for _ in range(10)))
+    assert peak == 2
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive TokenBucket with a fake monotonic clock and instant sleeps."""
+    now = [1000.0]
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(ratelimit, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(ratelimit, "asyncio", types.SimpleNamespace(sleep=sleep, Lock=asyncio.Lock))
+    return now, sleeps
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_throttles(fake_clock):
+    now, sleeps = fake_clock
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    assert sleeps == []
+
+    await bucket.acquire()
+    assert sleeps == [pytest.approx(0.05)]
+
+    now[0] += 0.1
+    await bucket.acquire()
+    await bucket.acquire()
+    assert len(sleeps) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_fractional_rate_banks_a_token(fake_clock):
+    now, sleeps = fake_clock
+    bucket = TokenBucket(rate=0.5, capacity=0.5)
+    assert bucket.capacity == 1.0
+
+    await bucket.acquire()
+    assert sleeps == []
+
+    now[0] += 3
+    await bucket.acquire()
+    assert sleeps == []
+
+    await bucket.acquire()
+    assert sleeps == [pytest.approx(2.0)]
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -0,0 +1,52 @@
+"""Tests for JinaClient's per-URL reader cache."""
+import types
+
+import httpx
+import orjson
+import pytest
+
+import jina_mcp.client as client_module
+from jina_mcp.config import settings
+
+
+def _ok(data):
+    return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+async def test_reader_cache_expires_after_ttl(make_client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client_module, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(settings, "jina_reader_cache_ttl", 10.0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return _ok({"content": f"v{len(calls)}"})
+
+    client = make_client(handler)
+    assert await client.read_url("https://a") == "v1"
+    now[0] += 5
+    assert await client.read_url("https://a") == "v1"
+    now[0] += 10
+    assert await client.read_url("https://a") == "v2"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_reader_cache_evicts_least_recently_used(make_client, monkeypatch):
+    monkeypatch.setattr(client_module, "READER_CACHE_MAXSIZE", 2)
+    calls = []
+
+    def handler(request):
+        url = orjson.loads(request.content)["url"]
+        calls.append(url)
+        return _ok({"content": url})
+
+    client = make_client(handler)
+    for url in ("https://a", "https://b", "https://a", "https://c"):
+        await client.read_url(url)
+    # "b" was least recently used when "c" was added
+    await client.read_url("https://a")
+    await client.read_url("https://b")
+    assert calls == ["https://a", "https://b", "https://c", "https://b"]
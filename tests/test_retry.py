@@ -0,0 +1,101 @@
+"""Tests for JinaClient retries of throttled (429/503) responses."""
+import asyncio
+
+import httpx
+import pytest
+
+import jina_mcp.client as client_module
+from jina_mcp.client import JinaClient
+
+
+def _ok(data):
+    return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+async def test_retry_honours_retry_after(make_client, monkeypatch):
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return _ok([{"title": "ok"}])
+
+    client = make_client(handler)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await client.search("q") == [{"title": "ok"}]
+    assert loop.time() - start >= 0.2
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_on_503_gives_up_after_max_retries(make_client, monkeypatch):
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = make_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.search("q")
+    assert len(calls) == client_module.MAX_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_max_fails_fast(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    client = make_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.search("q")
+    assert len(calls) == 1
+
+
+def test_retry_delay_is_not_capped_below_retry_after(monkeypatch):
+    monkeypatch.setattr(client_module.random, "random", lambda: 1.0)
+    response = httpx.Response(429, headers={"Retry-After": "120"})
+    assert JinaClient._retry_delay(response, 0) == 120.0
+
+    response = httpx.Response(429)
+    assert JinaClient._retry_delay(response, 20) == client_module.RETRY_BACKOFF_CAP
+
+
+@pytest.mark.asyncio
+async def test_concurrent_throttled_callers_back_off_in_parallel(make_client, monkeypatch):
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+    real_sleep = asyncio.sleep
+    delays = []
+    sleeping = peak = 0
+
+    async def tracking_sleep(delay):
+        nonlocal sleeping, peak
+        delays.append(delay)
+        sleeping += 1
+        peak = max(peak, sleeping)
+        await real_sleep(delay)
+        sleeping -= 1
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", tracking_sleep)
+    seen = set()
+
+    def handler(request):
+        if request.content not in seen:
+            seen.add(request.content)
+            return httpx.Response(429, headers={"Retry-After": "0.05"})
+        return _ok([])
+
+    client = make_client(handler)
+    results = await asyncio.gather(*(client.search(f"q{i}") for i in range(5)))
+    assert results == [[]] * 5
+    # Every caller waits exactly its Retry-After, and all of them at once
+    assert delays == [0.05] * 5
+    assert peak == 5
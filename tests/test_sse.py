@@ -0,0 +1,122 @@
+"""Tests for the server's pre-encoded SSE frames and fan-out."""
+import asyncio
+
+import orjson
+import pytest
+
+from jina_mcp import server
+from jina_mcp.server import PING_FRAME, _build_sse_frame, broadcast_message, event_generator
+
+
+class FakeRequest:
+    """Request stub whose disconnect state the test controls."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def test_build_sse_frame_encodes_all_fields():
+    frame = _build_sse_frame("message", b'{"a":1}', "abc", 30000)
+    assert frame == b'event: message\ndata: {"a":1}\nid: abc\nretry: 30000\n\n'
+
+
+def test_build_sse_frame_splits_multiline_data():
+    frame = _build_sse_frame("message", b"one\ntwo")
+    assert frame == b"event: message\ndata: one\ndata: two\n\n"
+
+
+def test_ping_frame_is_prebuilt():
+    assert PING_FRAME == b"event: ping\ndata: \n\n"
+
+
+@pytest.mark.asyncio
+async def test_event_generator_yields_bytes_frames():
+    request = FakeRequest()
+    events = event_generator(request)
+
+    connection = await events.__anext__()
+    assert connection.startswith(b"event: connection\ndata: ")
+    payload = orjson.loads(connection.split(b"data: ", 1)[1].split(b"\n", 1)[0])
+    assert payload["status"] == "connected"
+    assert len(server.sse_clients) == 1
+
+    next_frame = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    await broadcast_message("update", {"n": 1})
+    frame = await next_frame
+    assert frame.startswith(b'event: update\ndata: {"n":1}\nid: ')
+    assert frame.endswith(b"\nretry: 30000\n\n")
+
+    await events.aclose()
+    assert not server.sse_clients
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_one_frame_object():
+    queues = [asyncio.Queue(), asyncio.Queue()]
+    server.sse_clients.update(queues)
+    try:
+        await broadcast_message("update", {"n": 1})
+        first, second = (q.get_nowait() for q in queues)
+        assert first is second
+    finally:
+        server.sse_clients.difference_update(queues)
+
+
+@pytest.mark.asyncio
+async def test_event_generator_pings_when_idle(monkeypatch):
+    monkeypatch.setattr(server, "SSE_KEEPALIVE_INTERVAL", 0.01)
+    events = event_generator(FakeRequest())
+    await events.__anext__()
+
+    assert await events.__anext__() is PING_FRAME
+    # The queue still delivers messages after an idle interval
+    next_frame = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    await broadcast_message("update", {"n": 2})
+    assert (await next_frame).startswith(b"event: update\n")
+
+    await events.aclose()
+    assert not server.sse_clients
+
+
+@pytest.mark.asyncio
+async def test_event_generator_stops_on_disconnect():
+    request = FakeRequest()
+    events = event_generator(request)
+    await events.__anext__()
+
+    request.disconnected = True
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
+    assert not server.sse_clients
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_oldest_frame_for_full_queue():
+    slow = asyncio.Queue(maxsize=2)
+    fast = asyncio.Queue(maxsize=2)
+    server.sse_clients.update((slow, fast))
+    try:
+        for n in range(3):
+            await broadcast_message("update", {"n": n})
+            if n < 2:
+                fast.get_nowait()
+        frames = [slow.get_nowait(), slow.get_nowait()]
+        assert [orjson.loads(f.split(b"data: ", 1)[1].split(b"\n", 1)[0])["n"] for f in frames] == [1, 2]
+        # The fast client was not affected by the slow one
+        assert b'"n":2' in fast.get_nowait()
+    finally:
+        server.sse_clients.difference_update((slow, fast))
+
+
+@pytest.mark.asyncio
+async def test_event_generator_queue_is_bounded():
+    events = event_generator(FakeRequest())
+    await events.__anext__()
+    (queue,) = server.sse_clients
+    assert queue.maxsize == server.SSE_QUEUE_MAXSIZE
+    await events.aclose()
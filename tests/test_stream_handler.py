@@ -0,0 +1,78 @@
+"""Tests for MCPStreamHandler SSE parsing."""
+import pytest
+
+import jina_mcp.client as client_module
+from jina_mcp.client import MCPStreamEvent, MCPStreamHandler
+
+STREAM = (
+    b'event: message\ndata: {"a": 1}\n\n'
+    b"\n\n"
+    b'event: progress\ndata: {"pct": 50}\n\n'
+    b"event: note\ndata: plain text\n\n"
+    b"data: {}\n\n"
+)
+
+EXPECTED = [
+    MCPStreamEvent(event="message", data={"a": 1}),
+    MCPStreamEvent(event="progress", data={"pct": 50}),
+    MCPStreamEvent(event="note", data={"raw": "plain text"}),
+    MCPStreamEvent(event="message", data={}),
+]
+
+
+class FakeResponse:
+    """Response stub that yields a body in fixed-size chunks."""
+
+    encoding = "utf-8"
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def aiter_bytes(self):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i:i + self.chunk_size]
+
+
+async def _collect(response):
+    return [event async for event in MCPStreamHandler(response)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(STREAM)])
+async def test_events_survive_any_chunk_split(chunk_size):
+    assert await _collect(FakeResponse(STREAM, chunk_size)) == EXPECTED
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+async def test_buffer_compaction_keeps_events_intact(chunk_size, monkeypatch):
+    monkeypatch.setattr(client_module, "SSE_BUFFER_COMPACT_THRESHOLD", 4)
+    assert await _collect(FakeResponse(STREAM * 3, chunk_size)) == EXPECTED * 3
+
+
+@pytest.mark.asyncio
+async def test_incomplete_trailing_event_is_not_emitted():
+    body = STREAM + b"event: partial\ndata: {}"
+    assert await _collect(FakeResponse(body, 5)) == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b"event: update\ndata: {\"k\": \"a:b\"}", MCPStreamEvent("update", {"k": "a:b"})),
+        (b"event:update\ndata:{}", MCPStreamEvent("update", {})),
+        (b"event: update\r\ndata: {\"n\": 1}\r", MCPStreamEvent("update", {"n": 1})),
+        (b": comment\nno colon here\ndata: {\"n\": 2}", MCPStreamEvent("message", {"n": 2})),
+        (b"data: {broken", MCPStreamEvent("message", {"raw": "{broken"})),
+        (b"id: 7\nretry: 100", MCPStreamEvent("message", {})),
+    ],
+)
+def test_parse_event_on_bytes(raw, expected):
+    handler = MCPStreamHandler(FakeResponse(b"", 1))
+    assert handler._parse_event(raw) == expected
+
+
+def test_parse_event_returns_none_on_undecodable_event_name():
+    handler = MCPStreamHandler(FakeResponse(b"", 1))
+    assert handler._parse_event(b"event: \xff\xfe") is None
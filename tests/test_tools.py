@@ -0,0 +1,19 @@
+"""Tests for the JinaTools MCP tool registry."""
+from jina_mcp.tools import JinaTools
+
+
+def test_list_tools_returns_serialized_definitions():
+    tools = JinaTools(client=None)
+    listed = tools.list_tools()
+    assert [t["name"] for t in listed] == ["jina_reader", "jina_search"]
+    assert listed == [t.model_dump() for t in tools._tools.values()]
+
+
+def test_list_tools_returns_independent_copies():
+    tools = JinaTools(client=None)
+    first = tools.list_tools()
+    first[0]["name"] = "changed"
+    first[0]["parameters"].clear()
+    second = tools.list_tools()
+    assert second[0]["name"] == "jina_reader"
+    assert second[0]["parameters"]